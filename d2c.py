@@ -1,34 +1,100 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+import json
+import math
+import random
+import re
+import threading
 import time
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Literal, Optional, Self
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Iterator,
+    Literal,
+    Optional,
+    Self,
+    get_args,
+)
 
 import requests
-from pydantic import BaseModel, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    TypeAdapter,
+    ValidationError,
+    computed_field,
+)
+from pydantic_core import from_json
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+if TYPE_CHECKING:
+    import httpx
 
 SandboxType = Literal["postgres", "redis"]
+WaitMode = Literal["poll", "longpoll", "batch"]
+
+# Bounds (seconds) for the decorrelated-jitter poll schedule in create_sandbox.
+_POLL_BASE = 0.2
+_POLL_CAP = 5.0
+# Longest wait (seconds) requested from the server per long-poll call, and the
+# extra read-timeout slack allowed on top of it before giving up on a call.
+_LONGPOLL_MAX = 30
+_LONGPOLL_GRACE = 5
+# Gateway errors the wait loops ride out like 429/503, alongside connection
+# errors and timeouts.
+_TRANSIENT_STATUSES = (502, 504)
+# Connection pool size per scheme; sized for concurrent polls and deletes.
+_POOL_SIZE = 32
+# Maximum number of IDs sent in a single batch-delete request.
+_BATCH_DELETE_MAX = 100
+# Read size (bytes) when streaming the sandbox list.
+_STREAM_CHUNK = 64 * 1024
+
+# create_sandbox request bodies, serialised once per sandbox type.
+_CREATE_BODIES = {
+    t: json.dumps({"sandbox_type": t}).encode() for t in get_args(SandboxType)
+}
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
 
 
 class SandboxResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     sandbox_type: SandboxType
-    status: Optional[str]
+    status: Optional[str] = None
     created_at: datetime
     credentials: Optional[dict[str, Any]] = None
-    url: Optional[str] = None
 
-    @model_validator(mode="after")
-    def validate_credentials(self) -> Self:
-        try:
-            if self.sandbox_type == "postgres":
-                self.url = f"postgresql://{self.credentials['user']}:{self.credentials['password']}@{self.credentials['host']}:{self.credentials['port']}/{self.credentials['database']}"
-            elif self.sandbox_type == "redis":
-                self.url = f"redis://{self.credentials['user']}:{self.credentials['password']}@{self.credentials['host']}:{self.credentials['port']}"
-        except Exception:
-            pass
-        return self
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def url(self) -> Optional[str]:
+        c = self.credentials
+        if not c:
+            return None
+        if self.sandbox_type == "postgres":
+            pg_keys = ("user", "password", "host", "port", "database")
+            if all(k in c for k in pg_keys):
+                return "postgresql://%s:%s@%s:%s/%s" % tuple(c[k] for k in pg_keys)
+        elif self.sandbox_type == "redis":
+            redis_keys = ("user", "password", "host", "port")
+            if all(k in c for k in redis_keys):
+                return "redis://%s:%s@%s:%s" % tuple(c[k] for k in redis_keys)
+        return None
+
+
+# Validators are built once here rather than on every parse. Responses are
+# validated from raw bytes, so JSON decoding and created_at parsing both
+# happen in pydantic-core.
+_SANDBOX_ADAPTER = TypeAdapter(SandboxResponse)
+_SANDBOX_LIST_ADAPTER = TypeAdapter(list[SandboxResponse])
 
 
 class Dev2CloudError(Exception):
@@ -40,7 +106,294 @@ class Dev2CloudError(Exception):
         super().__init__(f"[{status_code}] {detail}")
 
 
-class Dev2Cloud:
+class Dev2CloudRetryableError(Dev2CloudError):
+    """Raised when the API is temporarily overloaded (429 or 503).
+
+    ``retry_after`` holds the seconds the server asked clients to wait
+    (from the ``Retry-After`` header), or 0 if it gave no hint.
+    """
+
+    def __init__(self, status_code: int, detail: str, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__(status_code, detail)
+
+
+def _json(response: requests.Response | httpx.Response) -> Any:
+    """Decodes a JSON response body straight from bytes with pydantic-core."""
+    return from_json(response.content)
+
+
+class _JSONArrayParser:
+    """Incrementally parses a JSON array, returning elements as bytes arrive.
+
+    Raises :class:`Dev2CloudError` unless the input is exactly one
+    well-formed array (surrounded by optional whitespace).
+    """
+
+    _WS = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        # One of: "start", "first" (value or "]"), "value", "next" ("," or
+        # "]"), "done".
+        self._state = "start"
+
+    @staticmethod
+    def _malformed() -> Dev2CloudError:
+        return Dev2CloudError(0, "Malformed or truncated sandbox list response")
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        try:
+            buf = self._buf + self._utf8.decode(chunk)
+        except UnicodeDecodeError as exc:
+            raise self._malformed() from exc
+        pos = 0
+        items: list[Any] = []
+        while True:
+            ws = self._WS.match(buf, pos)
+            if ws is not None:
+                pos = ws.end()
+            if pos == len(buf):
+                break
+            char = buf[pos]
+            if self._state == "start":
+                if char != "[":
+                    raise self._malformed()
+                self._state = "first"
+                pos += 1
+            elif self._state == "done":
+                raise self._malformed()
+            elif char == "]" and self._state in ("first", "next"):
+                self._state = "done"
+                pos += 1
+            elif self._state == "next":
+                if char != ",":
+                    raise self._malformed()
+                self._state = "value"
+                pos += 1
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    break  # element is incomplete; wait for more bytes
+                if end == len(buf):
+                    break  # a number may continue in the next chunk
+                items.append(item)
+                self._state = "next"
+                pos = end
+        self._buf = buf[pos:]
+        return items
+
+    def close(self) -> None:
+        try:
+            tail = self._buf + self._utf8.decode(b"", final=True)
+        except UnicodeDecodeError as exc:
+            raise self._malformed() from exc
+        if self._state != "done" or tail.strip(" \t\n\r"):
+            raise self._malformed()
+
+
+def _validate_sandboxes(items: list[Any]) -> list[SandboxResponse]:
+    """Validates streamed list elements, treating bad ones as a malformed list."""
+    try:
+        return _SANDBOX_LIST_ADAPTER.validate_python(items)
+    except ValidationError as exc:
+        raise _JSONArrayParser._malformed() from exc
+
+
+def _create_body(sandbox_type: SandboxType) -> bytes:
+    """Returns the JSON body for creating a sandbox of ``sandbox_type``."""
+    body = _CREATE_BODIES.get(sandbox_type)
+    if body is None:
+        # Unknown type: send it anyway and let the API reject it.
+        body = json.dumps({"sandbox_type": sandbox_type}).encode()
+    return body
+
+
+def _retry_after(response: requests.Response | httpx.Response) -> float:
+    """Returns the ``Retry-After`` delay of a response in seconds (0 if absent)."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _next_delay(delay: float) -> float:
+    """Returns the next decorrelated-jitter poll delay after ``delay``."""
+    return min(_POLL_CAP, random.uniform(_POLL_BASE, delay * 3))
+
+
+class _BaseClient:
+    """Helpers shared by the blocking and asyncio clients."""
+
+    def __init__(self, api_url: str) -> None:
+        self._api_url = api_url.rstrip("/")
+        # Endpoint URLs are built once; per-sandbox URLs use %-formatting.
+        self._sandboxes_url = f"{self._api_url}/api/v1/sandboxes"
+        self._sandbox_url_tmpl = self._sandboxes_url + "/%s"
+        self._batch_delete_url = self._sandboxes_url + ":batchDelete"
+
+    @staticmethod
+    def _raise_on_error(response: requests.Response | httpx.Response) -> None:
+        if response.status_code < 400:
+            return
+        # Decode the body as UTF-8 directly; response.text would first run
+        # charset detection on it.
+        text = response.content.decode("utf-8", "replace")
+        try:
+            detail = _json(response).get("detail", text)
+        except ValueError:
+            detail = text
+        if response.status_code in (429, 503):
+            raise Dev2CloudRetryableError(
+                response.status_code, detail, _retry_after(response)
+            )
+        raise Dev2CloudError(response.status_code, detail)
+
+    @staticmethod
+    def _created_sandbox(data: dict[str, Any]) -> Optional[SandboxResponse]:
+        # A create response only short-circuits the wait when it carries a
+        # full sandbox with a definite non-pending status; anything else
+        # (no status, missing fields) is waited on from its id alone.
+        if data.get("status") in (None, "pending"):
+            return None
+        try:
+            return _SANDBOX_ADAPTER.validate_python(data)
+        except ValidationError:
+            return None
+
+
+class _Watch:
+    """A pending sandbox registered with :class:`_SandboxPoller`."""
+
+    __slots__ = ("event", "sandbox", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.sandbox: Optional[SandboxResponse] = None
+        self.error: Optional[Exception] = None
+
+
+class _SandboxPoller:
+    """Polls many pending sandboxes with one list request per tick.
+
+    ``create_sandbox(..., wait="batch")`` calls register their sandbox here
+    instead of polling it individually, so the request rate stays at one
+    list per tick however many creates are in flight. A daemon thread runs
+    only while at least one sandbox is watched.
+
+    A sandbox is fetched on its own only once it has left ``pending`` in
+    the list (list entries carry no credentials), or when it was in the
+    list on an earlier tick and has since dropped out (e.g. it failed).
+    Either way that costs one extra request per sandbox, not one per
+    tick. A sandbox the list never reports
+    is waited on until it appears or the caller's timeout expires.
+    Transport errors are retried on the next tick; API errors are handed
+    to the affected waiters.
+    """
+
+    def __init__(self, client: Dev2Cloud) -> None:
+        self._client = client
+        self._lock = threading.Lock()
+        self._watches: dict[str, list[_Watch]] = {}
+        self._running = False
+        # Watched IDs seen in the list; only touched by the poller thread.
+        self._listed: set[str] = set()
+
+    def watch(self, sandbox_id: str) -> _Watch:
+        watch = _Watch()
+        with self._lock:
+            self._watches.setdefault(sandbox_id, []).append(watch)
+            if not self._running:
+                self._running = True
+                threading.Thread(
+                    target=self._run, name="d2c-sandbox-poller", daemon=True
+                ).start()
+        return watch
+
+    def unwatch(self, sandbox_id: str, watch: _Watch) -> None:
+        with self._lock:
+            watches = self._watches.get(sandbox_id)
+            if watches and watch in watches:
+                watches.remove(watch)
+                if not watches:
+                    del self._watches[sandbox_id]
+
+    def _deliver(
+        self,
+        sandbox_id: str,
+        sandbox: Optional[SandboxResponse] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        with self._lock:
+            watches = self._watches.pop(sandbox_id, [])
+        for watch in watches:
+            watch.sandbox = sandbox
+            watch.error = error
+            watch.event.set()
+
+    def _run(self) -> None:
+        delay = _POLL_BASE
+        retry_after = 0.0
+        while True:
+            delay = _next_delay(delay)
+            time.sleep(max(delay, retry_after))
+            retry_after = 0.0
+            with self._lock:
+                if not self._watches:
+                    self._running = False
+                    self._listed.clear()
+                    return
+                ids = list(self._watches)
+            self._listed.intersection_update(ids)
+            try:
+                listed = {sb.id: sb for sb in self._client.list_sandboxes()}
+            except Dev2CloudRetryableError as exc:
+                retry_after = exc.retry_after
+                continue
+            except requests.RequestException:
+                continue
+            except Exception as exc:
+                for sandbox_id in ids:
+                    self._deliver(sandbox_id, error=exc)
+                continue
+            for sandbox_id in ids:
+                sandbox = listed.get(sandbox_id)
+                if sandbox is not None:
+                    self._listed.add(sandbox_id)
+                    if sandbox.status == "pending":
+                        continue
+                elif sandbox_id not in self._listed:
+                    continue
+                # Settled (list entries carry no credentials) or dropped out
+                # of the active list; fetch the full sandbox once.
+                try:
+                    sandbox = self._client.get_sandbox(sandbox_id)
+                except Dev2CloudRetryableError as exc:
+                    retry_after = exc.retry_after
+                    continue
+                except requests.RequestException:
+                    continue
+                except Exception as exc:
+                    self._deliver(sandbox_id, error=exc)
+                    continue
+                if sandbox.status != "pending":
+                    self._deliver(sandbox_id, sandbox)
+
+
+class Dev2Cloud(_BaseClient):
     """Client for the Dev2Cloud sandbox management API.
 
     Example::
@@ -61,41 +414,244 @@ class Dev2Cloud:
         client.delete_sandbox(sandbox.id)
     """
 
-    def __init__(self, api_key: str, api_url: str = "https://api.dev2.cloud") -> None:
+    # Shared sessions keyed by (api_url, api_key); see ``share_session``.
+    _SESSIONS: dict[tuple[str, str], requests.Session] = {}
+    _SESSIONS_LOCK = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = "https://api.dev2.cloud",
+        *,
+        request_timeout: float = 30,
+        share_session: bool = False,
+    ) -> None:
         """Initialise the Dev2Cloud client.
 
+        Connections are kept alive in a pooled session. Idempotent requests
+        (``GET``/``DELETE``) are retried with exponential backoff on
+        connection errors and on 429/502/503/504 responses, honouring the
+        server's ``Retry-After`` header.
+
         Args:
             api_key: API key used to authenticate requests (sent as ``X-Api-Key`` header).
             api_url: Base URL of the Dev2Cloud API. Defaults to ``https://api.dev2.cloud``.
+            request_timeout: Default per-request timeout in seconds.
+                Defaults to 30.
+            share_session: Reuse one process-wide session (and its
+                connection pool) for every client with the same
+                ``api_url`` and ``api_key``. The session is safe to use
+                from several threads, as the client only sends requests
+                through it and never changes its configuration.
         """
-        self._api_url = api_url.rstrip("/")
-        self._session = requests.Session()
-        self._session.headers.update({"X-Api-Key": api_key})
+        super().__init__(api_url)
+        self._request_timeout = request_timeout
+        self._shared = share_session
+        if share_session:
+            key = (self._api_url, api_key)
+            with Dev2Cloud._SESSIONS_LOCK:
+                session = Dev2Cloud._SESSIONS.get(key)
+                if session is None:
+                    session = Dev2Cloud._SESSIONS[key] = self._build_session(api_key)
+            self._session = session
+        else:
+            self._session = self._build_session(api_key)
+        # Status polls go through their own adapter with no retries: a
+        # retried 503 or read timeout would wait out urllib3's backoff and
+        # ignore the create_sandbox deadline. The wait loops back off
+        # themselves, clamped to the deadline.
+        self._poll_adapter = HTTPAdapter(pool_maxsize=_POOL_SIZE, max_retries=0)
+        self._poller = _SandboxPoller(self)
+
+    @staticmethod
+    def _build_session(api_key: str) -> requests.Session:
+        session = requests.Session()
+        # Advertise every content coding urllib3 can decode here (brotli /
+        # zstd when their optional packages are installed).
+        accept_encoding = make_headers(accept_encoding=True)["accept-encoding"]
+        session.headers.update(
+            {
+                "X-Api-Key": api_key,
+                "Accept": "application/json",
+                "Accept-Encoding": accept_encoding,
+            }
+        )
+        retry = Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_SIZE,
+            pool_maxsize=_POOL_SIZE,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Closes the underlying session and its pooled connections.
+
+        Shared sessions (``share_session=True``) are left open for the
+        other clients using them; see :meth:`close_all`.
+        """
+        self._poll_adapter.close()
+        if not self._shared:
+            self._session.close()
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Closes every shared session and forgets it.
+
+        Clients still holding a closed shared session will open fresh
+        connections on their next request.
+        """
+        with cls._SESSIONS_LOCK:
+            sessions = list(cls._SESSIONS.values())
+            cls._SESSIONS.clear()
+        for session in sessions:
+            session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     # -- helpers ----------------------------------------------------------
 
-    def _url(self, path: str) -> str:
-        return f"{self._api_url}{path}"
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self._request_timeout)
+        return self._session.request(method, url, **kwargs)
 
-    @staticmethod
-    def _raise_on_error(response: requests.Response) -> None:
-        if response.ok:
-            return
+    def _poll_settings(self, url: str) -> dict[str, Any]:
+        # Proxy / TLS / stream settings that Session.request would merge in,
+        # as keyword arguments for self._poll_adapter.send().
+        settings: dict[str, Any] = dict(
+            self._session.merge_environment_settings(url, {}, None, None, None)
+        )
+        return settings
+
+    def _wait_poll(
+        self, sandbox_id: str, deadline: float
+    ) -> Optional[SandboxResponse]:
+        # Every poll is the same GET, so prepare it (and resolve the proxy /
+        # TLS settings Session.request would merge in) once and resend it.
+        url = self._sandbox_url_tmpl % sandbox_id
+        request = self._session.prepare_request(requests.Request("GET", url))
+        settings = self._poll_settings(url)
+        delay = _POLL_BASE
+        retry_after = 0.0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            delay = _next_delay(delay)
+            time.sleep(min(max(delay, retry_after), remaining))
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            retry_after = 0.0
+            try:
+                response = self._poll_adapter.send(
+                    request, timeout=min(self._request_timeout, remaining), **settings
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                continue
+            if response.status_code in _TRANSIENT_STATUSES:
+                continue
+            try:
+                self._raise_on_error(response)
+            except Dev2CloudRetryableError as exc:
+                retry_after = exc.retry_after
+                continue
+            sandbox = _SANDBOX_ADAPTER.validate_json(response.content)
+            if sandbox.status != "pending":
+                return sandbox
+
+    def _wait_longpoll(
+        self, sandbox_id: str, deadline: float
+    ) -> Optional[SandboxResponse]:
+        url = self._sandbox_url_tmpl % sandbox_id + "/wait"
+        settings = self._poll_settings(url)
+        delay = _POLL_BASE
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            wait = min(_LONGPOLL_MAX, remaining)
+            request = self._session.prepare_request(
+                requests.Request("GET", url, params={"timeout": math.ceil(wait)})
+            )
+            retry_after: Optional[float] = None
+            try:
+                response = self._poll_adapter.send(
+                    request, timeout=wait + _LONGPOLL_GRACE, **settings
+                )
+            except requests.exceptions.ReadTimeout:
+                continue  # the server held the call too long; try again
+            except (requests.ConnectionError, requests.Timeout):
+                retry_after = 0.0
+            else:
+                if response.status_code in (404, 405):
+                    # Server has no long-poll endpoint; fall back to polling.
+                    return self._wait_poll(sandbox_id, deadline)
+                if response.status_code in _TRANSIENT_STATUSES:
+                    retry_after = 0.0
+                else:
+                    try:
+                        self._raise_on_error(response)
+                    except Dev2CloudRetryableError as exc:
+                        retry_after = exc.retry_after
+            if retry_after is not None:
+                delay = _next_delay(delay)
+                pause = min(max(delay, retry_after), deadline - time.monotonic())
+                time.sleep(max(0.0, pause))
+                continue
+            sandbox = _SANDBOX_ADAPTER.validate_json(response.content)
+            if sandbox.status != "pending":
+                return sandbox
+
+    def _wait_batch(
+        self, sandbox_id: str, deadline: float
+    ) -> Optional[SandboxResponse]:
+        watch = self._poller.watch(sandbox_id)
         try:
-            detail = response.json().get("detail", response.text)
-        except ValueError:
-            detail = response.text
-        raise Dev2CloudError(response.status_code, detail)
+            if not watch.event.wait(max(0.0, deadline - time.monotonic())):
+                return None
+        finally:
+            self._poller.unwatch(sandbox_id, watch)
+        error = watch.error
+        if error is not None:
+            # The poller may hand one error to several waiters; raise a
+            # fresh exception in each so they don't share a traceback.
+            if isinstance(error, Dev2CloudError):
+                raise Dev2CloudError(error.status_code, error.detail) from error
+            raise Dev2CloudError(
+                0, f"Polling sandbox {sandbox_id} failed: {error}"
+            ) from error
+        return watch.sandbox
 
-    @staticmethod
-    def _parse_sandbox(data: dict[str, Any]) -> SandboxResponse:
-        return SandboxResponse(
-            id=data["id"],
-            sandbox_type=data["sandbox_type"],
-            status=data.get("status"),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            credentials=data.get("credentials"),
-        )
+    def _delete_each(self, ids: list[str], max_workers: int) -> list[str]:
+        deleted: list[str] = []
+        if not ids:
+            return deleted
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ids))) as ex:
+            futures = {
+                sandbox_id: ex.submit(self.delete_sandbox, sandbox_id)
+                for sandbox_id in ids
+            }
+            for sandbox_id, future in futures.items():
+                try:
+                    future.result()
+                    deleted.append(sandbox_id)
+                except Dev2CloudError:
+                    pass
+        return deleted
 
     # -- public API -------------------------------------------------------
 
@@ -108,23 +664,58 @@ class Dev2Cloud:
         Raises:
             Dev2CloudError: If the API returns an error response.
         """
-        response = self._session.get(self._url("/api/v1/sandboxes"))
+        response = self._request("GET", self._sandboxes_url)
         self._raise_on_error(response)
-        return [self._parse_sandbox(item) for item in response.json()]
+        return _SANDBOX_LIST_ADAPTER.validate_json(response.content)
+
+    def iter_sandboxes(self) -> Iterator[SandboxResponse]:
+        """Iterates over all active sandboxes for the authenticated user.
+
+        Unlike :meth:`list_sandboxes`, the response is parsed as it streams
+        in and sandboxes are yielded one at a time, so the full list is
+        never held in memory.
+
+        Yields:
+            Sandbox objects sorted by creation time.
+
+        Raises:
+            Dev2CloudError: If the API returns an error response or the
+                list is malformed.
+        """
+        with self._request("GET", self._sandboxes_url, stream=True) as response:
+            self._raise_on_error(response)
+            parser = _JSONArrayParser()
+            for chunk in response.iter_content(_STREAM_CHUNK):
+                items = parser.feed(chunk)
+                yield from _validate_sandboxes(items)
+            parser.close()
 
     def create_sandbox(
-        self, sandbox_type: SandboxType, *, timeout: float = 180
+        self,
+        sandbox_type: SandboxType,
+        *,
+        timeout: float = 180,
+        wait: WaitMode = "longpoll",
     ) -> SandboxResponse:
         """Creates a new sandbox and waits for it to be ready.
 
-        Provisions a sandbox and polls its status once per second until it
-        transitions to ``running`` (credentials will be available) or
-        ``failed``.
+        Provisions a sandbox and waits until it transitions to ``running``
+        (credentials will be available) or ``failed``. A sandbox that is
+        already past ``pending`` when created (e.g. from a warm pool) is
+        returned without waiting. Otherwise, by default the server's
+        long-poll endpoint is used, which returns as soon as the status
+        changes; servers without it fall back to polling. Polls are spaced
+        with decorrelated-jitter backoff (200ms up to 5s) so fast provisions
+        return quickly and concurrent clients don't poll in lockstep.
 
         Args:
             sandbox_type: The type of sandbox to create (``"postgres"`` or ``"redis"``).
             timeout: Maximum seconds to wait for the sandbox to become
                 ready. Defaults to 180 (3 minutes).
+            wait: How to wait for readiness: ``"longpoll"`` (default),
+                ``"poll"``, or ``"batch"``, which shares one list request
+                per poll tick among all of this client's concurrent
+                ``create_sandbox`` calls.
 
         Returns:
             The sandbox object with ``running`` status and connection credentials.
@@ -133,23 +724,30 @@ class Dev2Cloud:
             Dev2CloudError: If the sandbox transitions to ``failed`` or
                 does not become ready within ``timeout`` seconds.
         """
-        response = self._session.post(
-            self._url("/api/v1/sandboxes"),
-            json={"sandbox_type": sandbox_type},
+        response = self._request(
+            "POST",
+            self._sandboxes_url,
+            data=_create_body(sandbox_type),
+            headers=_JSON_CONTENT_TYPE,
         )
         self._raise_on_error(response)
-        sandbox_id = response.json()["id"]
+        data = _json(response)
+        sandbox_id = data["id"]
 
-        deadline = time.monotonic() + timeout
-        while True:
-            if time.monotonic() >= deadline:
+        sandbox = self._created_sandbox(data)
+        if sandbox is None:
+            deadline = time.monotonic() + timeout
+            if wait == "longpoll":
+                ready = self._wait_longpoll(sandbox_id, deadline)
+            elif wait == "batch":
+                ready = self._wait_batch(sandbox_id, deadline)
+            else:
+                ready = self._wait_poll(sandbox_id, deadline)
+            if ready is None:
                 raise Dev2CloudError(
                     0, f"Sandbox {sandbox_id} did not become ready within {timeout}s"
                 )
-            time.sleep(1)
-            sandbox = self.get_sandbox(sandbox_id)
-            if sandbox.status != "pending":
-                break
+            sandbox = ready
 
         if sandbox.status == "failed":
             raise Dev2CloudError(0, f"Sandbox {sandbox_id} failed to provision")
@@ -168,9 +766,9 @@ class Dev2Cloud:
         Raises:
             Dev2CloudError: If the API returns an error response.
         """
-        response = self._session.get(self._url(f"/api/v1/sandboxes/{sandbox_id}"))
+        response = self._request("GET", self._sandbox_url_tmpl % sandbox_id)
         self._raise_on_error(response)
-        return self._parse_sandbox(response.json())
+        return _SANDBOX_ADAPTER.validate_json(response.content)
 
     def delete_sandbox(self, sandbox_id: str) -> None:
         """Permanently deletes a sandbox.
@@ -184,25 +782,416 @@ class Dev2Cloud:
         Raises:
             Dev2CloudError: If the API returns an error response.
         """
-        response = self._session.delete(self._url(f"/api/v1/sandboxes/{sandbox_id}"))
+        response = self._request("DELETE", self._sandbox_url_tmpl % sandbox_id)
         self._raise_on_error(response)
 
-    def delete_all(self) -> list[str]:
+    def delete_sandboxes(
+        self, ids: list[str], *, max_workers: int = _POOL_SIZE
+    ) -> list[str]:
+        """Permanently deletes several sandboxes.
+
+        IDs are sent to the batch-delete endpoint in chunks of up to 100,
+        so deleting many sandboxes costs one round-trip per chunk. Servers
+        without the batch endpoint fall back to concurrent individual
+        deletes. Errors for a chunk or an individual sandbox are silently
+        ignored so that one failure does not prevent the remaining
+        sandboxes from being removed; the returned list says which ones
+        are gone.
+
+        Args:
+            ids: The unique identifiers of the sandboxes to delete.
+            max_workers: Maximum number of concurrent delete requests when
+                falling back to individual deletes. Defaults to the
+                connection pool size (32).
+
+        Returns:
+            A list of sandbox IDs that were successfully deleted.
+        """
+        deleted: list[str] = []
+        for start in range(0, len(ids), _BATCH_DELETE_MAX):
+            response = self._request(
+                "POST",
+                self._batch_delete_url,
+                json={"ids": ids[start : start + _BATCH_DELETE_MAX]},
+            )
+            if response.status_code in (404, 405):
+                # Server has no batch endpoint; delete the rest one by one.
+                return deleted + self._delete_each(ids[start:], max_workers)
+            try:
+                self._raise_on_error(response)
+            except Dev2CloudError:
+                continue  # skip this chunk, like a failed individual delete
+            deleted.extend(_json(response))
+        return deleted
+
+    def delete_all(self, *, max_workers: int = _POOL_SIZE) -> list[str]:
         """Deletes all active sandboxes.
 
-        Fetches the current sandbox list and deletes each one. Deletion
-        errors for individual sandboxes are silently ignored so that one
-        failure does not prevent the remaining sandboxes from being removed.
+        Fetches the current sandbox list and deletes every sandbox with
+        :meth:`delete_sandboxes`.
+
+        Args:
+            max_workers: Maximum number of concurrent delete requests when
+                the server lacks the batch endpoint. Defaults to the
+                connection pool size (32).
 
         Returns:
             A list of sandbox IDs that were successfully deleted.
+
+        Raises:
+            Dev2CloudError: If the sandbox list cannot be fetched.
         """
-        sandboxes = self.list_sandboxes()
+        ids = [sb.id for sb in self.list_sandboxes()]
+        return self.delete_sandboxes(ids, max_workers=max_workers)
+
+
+class AsyncDev2Cloud(_BaseClient):
+    """Asyncio client for the Dev2Cloud sandbox management API.
+
+    Mirrors :class:`Dev2Cloud` on top of ``httpx.AsyncClient`` (HTTP/2 with
+    a shared connection pool), so many sandbox operations can run
+    concurrently on one event loop. Requires ``httpx[http2]``.
+
+    Example::
+
+        from d2c import AsyncDev2Cloud
+
+        async with AsyncDev2Cloud(api_key="your-api-key") as client:
+            # Create several sandboxes concurrently
+            pg, redis = await client.create_many(["postgres", "redis"])
+            print(pg.url, redis.url)
+
+            await client.delete_all()
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = "https://api.dev2.cloud",
+        *,
+        request_timeout: float = 30,
+    ) -> None:
+        """Initialise the asyncio Dev2Cloud client.
+
+        Args:
+            api_key: API key used to authenticate requests (sent as ``X-Api-Key`` header).
+            api_url: Base URL of the Dev2Cloud API. Defaults to ``https://api.dev2.cloud``.
+            request_timeout: Default per-request timeout in seconds.
+                Defaults to 30.
+        """
+        import httpx
+
+        super().__init__(api_url)
+        self._request_timeout = request_timeout
+        self._client = httpx.AsyncClient(
+            headers={"X-Api-Key": api_key, "Accept": "application/json"},
+            http2=True,
+            timeout=request_timeout,
+            limits=httpx.Limits(
+                max_connections=2 * _POOL_SIZE,
+                max_keepalive_connections=_POOL_SIZE,
+                keepalive_expiry=30,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Closes the underlying client and its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    # -- helpers ----------------------------------------------------------
+
+    async def _wait_poll(
+        self, sandbox_id: str, deadline: float
+    ) -> Optional[SandboxResponse]:
+        import httpx
+
+        url = self._sandbox_url_tmpl % sandbox_id
+        delay = _POLL_BASE
+        retry_after = 0.0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            delay = _next_delay(delay)
+            await asyncio.sleep(min(max(delay, retry_after), remaining))
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            retry_after = 0.0
+            try:
+                response = await self._client.get(
+                    url, timeout=min(self._request_timeout, remaining)
+                )
+            except httpx.TransportError:
+                continue
+            if response.status_code in _TRANSIENT_STATUSES:
+                continue
+            try:
+                self._raise_on_error(response)
+            except Dev2CloudRetryableError as exc:
+                retry_after = exc.retry_after
+                continue
+            sandbox = _SANDBOX_ADAPTER.validate_json(response.content)
+            if sandbox.status != "pending":
+                return sandbox
+
+    async def _wait_longpoll(
+        self, sandbox_id: str, deadline: float
+    ) -> Optional[SandboxResponse]:
+        import httpx
+
+        url = self._sandbox_url_tmpl % sandbox_id + "/wait"
+        delay = _POLL_BASE
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            wait = min(_LONGPOLL_MAX, remaining)
+            retry_after: Optional[float] = None
+            try:
+                response = await self._client.get(
+                    url,
+                    params={"timeout": math.ceil(wait)},
+                    timeout=wait + _LONGPOLL_GRACE,
+                )
+            except httpx.ReadTimeout:
+                continue  # the server held the call too long; try again
+            except httpx.TransportError:
+                retry_after = 0.0
+            else:
+                if response.status_code in (404, 405):
+                    # Server has no long-poll endpoint; fall back to polling.
+                    return await self._wait_poll(sandbox_id, deadline)
+                if response.status_code in _TRANSIENT_STATUSES:
+                    retry_after = 0.0
+                else:
+                    try:
+                        self._raise_on_error(response)
+                    except Dev2CloudRetryableError as exc:
+                        retry_after = exc.retry_after
+            if retry_after is not None:
+                delay = _next_delay(delay)
+                pause = min(max(delay, retry_after), deadline - time.monotonic())
+                await asyncio.sleep(max(0.0, pause))
+                continue
+            sandbox = _SANDBOX_ADAPTER.validate_json(response.content)
+            if sandbox.status != "pending":
+                return sandbox
+
+    async def _delete_each(self, ids: list[str], max_workers: int) -> list[str]:
+        limit = asyncio.Semaphore(max_workers)
+
+        async def delete(sandbox_id: str) -> None:
+            async with limit:
+                await self.delete_sandbox(sandbox_id)
+
+        results = await asyncio.gather(
+            *(delete(sandbox_id) for sandbox_id in ids),
+            return_exceptions=True,
+        )
         deleted: list[str] = []
-        for sb in sandboxes:
+        for sandbox_id, result in zip(ids, results):
+            if result is None:
+                deleted.append(sandbox_id)
+            elif not isinstance(result, Dev2CloudError):
+                raise result
+        return deleted
+
+    # -- public API -------------------------------------------------------
+
+    async def list_sandboxes(self) -> list[SandboxResponse]:
+        """Lists all active sandboxes for the authenticated user.
+
+        Returns:
+            A list of sandbox objects sorted by creation time.
+
+        Raises:
+            Dev2CloudError: If the API returns an error response.
+        """
+        response = await self._client.get(self._sandboxes_url)
+        self._raise_on_error(response)
+        return _SANDBOX_LIST_ADAPTER.validate_json(response.content)
+
+    async def iter_sandboxes(self) -> AsyncIterator[SandboxResponse]:
+        """Iterates over all active sandboxes for the authenticated user.
+
+        See :meth:`Dev2Cloud.iter_sandboxes`.
+
+        Yields:
+            Sandbox objects sorted by creation time.
+
+        Raises:
+            Dev2CloudError: If the API returns an error response or the
+                list is malformed.
+        """
+        async with self._client.stream("GET", self._sandboxes_url) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                self._raise_on_error(response)
+            parser = _JSONArrayParser()
+            async for chunk in response.aiter_bytes(_STREAM_CHUNK):
+                items = parser.feed(chunk)
+                for sandbox in _validate_sandboxes(items):
+                    yield sandbox
+            parser.close()
+
+    async def create_sandbox(
+        self,
+        sandbox_type: SandboxType,
+        *,
+        timeout: float = 180,
+        wait: WaitMode = "longpoll",
+    ) -> SandboxResponse:
+        """Creates a new sandbox and waits for it to be ready.
+
+        See :meth:`Dev2Cloud.create_sandbox`.
+
+        Args:
+            sandbox_type: The type of sandbox to create (``"postgres"`` or ``"redis"``).
+            timeout: Maximum seconds to wait for the sandbox to become
+                ready. Defaults to 180 (3 minutes).
+            wait: How to wait for readiness: ``"longpoll"`` (default) or
+                ``"poll"``. ``"batch"`` is treated as ``"poll"``.
+
+        Returns:
+            The sandbox object with ``running`` status and connection credentials.
+
+        Raises:
+            Dev2CloudError: If the sandbox transitions to ``failed`` or
+                does not become ready within ``timeout`` seconds.
+        """
+        response = await self._client.post(
+            self._sandboxes_url,
+            content=_create_body(sandbox_type),
+            headers=_JSON_CONTENT_TYPE,
+        )
+        self._raise_on_error(response)
+        data = _json(response)
+        sandbox_id = data["id"]
+
+        sandbox = self._created_sandbox(data)
+        if sandbox is None:
+            deadline = time.monotonic() + timeout
+            if wait == "longpoll":
+                ready = await self._wait_longpoll(sandbox_id, deadline)
+            else:
+                ready = await self._wait_poll(sandbox_id, deadline)
+            if ready is None:
+                raise Dev2CloudError(
+                    0, f"Sandbox {sandbox_id} did not become ready within {timeout}s"
+                )
+            sandbox = ready
+
+        if sandbox.status == "failed":
+            raise Dev2CloudError(0, f"Sandbox {sandbox_id} failed to provision")
+
+        return sandbox
+
+    async def create_many(
+        self, sandbox_types: list[SandboxType], *, timeout: float = 180
+    ) -> list[SandboxResponse]:
+        """Creates several sandboxes concurrently and waits for all of them.
+
+        Args:
+            sandbox_types: The type of each sandbox to create.
+            timeout: Maximum seconds to wait for each sandbox to become
+                ready. Defaults to 180 (3 minutes).
+
+        Returns:
+            The sandbox objects, in the same order as ``sandbox_types``.
+
+        Raises:
+            Dev2CloudError: If any sandbox fails to provision or does not
+                become ready within ``timeout`` seconds.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.create_sandbox(t, timeout=timeout) for t in sandbox_types)
+            )
+        )
+
+    async def get_sandbox(self, sandbox_id: str) -> SandboxResponse:
+        """Gets a sandbox by its ID.
+
+        Args:
+            sandbox_id: The unique identifier of the sandbox.
+
+        Returns:
+            The sandbox object including its current status and credentials.
+
+        Raises:
+            Dev2CloudError: If the API returns an error response.
+        """
+        response = await self._client.get(self._sandbox_url_tmpl % sandbox_id)
+        self._raise_on_error(response)
+        return _SANDBOX_ADAPTER.validate_json(response.content)
+
+    async def delete_sandbox(self, sandbox_id: str) -> None:
+        """Permanently deletes a sandbox.
+
+        This action is irreversible. Connection credentials are revoked
+        immediately.
+
+        Args:
+            sandbox_id: The unique identifier of the sandbox to delete.
+
+        Raises:
+            Dev2CloudError: If the API returns an error response.
+        """
+        response = await self._client.delete(self._sandbox_url_tmpl % sandbox_id)
+        self._raise_on_error(response)
+
+    async def delete_sandboxes(
+        self, ids: list[str], *, max_workers: int = _POOL_SIZE
+    ) -> list[str]:
+        """Permanently deletes several sandboxes.
+
+        See :meth:`Dev2Cloud.delete_sandboxes`.
+
+        Args:
+            ids: The unique identifiers of the sandboxes to delete.
+            max_workers: Maximum number of concurrent delete requests when
+                falling back to individual deletes. Defaults to the
+                connection pool size (32).
+
+        Returns:
+            A list of sandbox IDs that were successfully deleted.
+        """
+        deleted: list[str] = []
+        for start in range(0, len(ids), _BATCH_DELETE_MAX):
+            response = await self._client.post(
+                self._batch_delete_url,
+                json={"ids": ids[start : start + _BATCH_DELETE_MAX]},
+            )
+            if response.status_code in (404, 405):
+                # Server has no batch endpoint; delete the rest one by one.
+                return deleted + await self._delete_each(ids[start:], max_workers)
             try:
-                self.delete_sandbox(sb.id)
-                deleted.append(sb.id)
+                self._raise_on_error(response)
             except Dev2CloudError:
-                pass
+                continue  # skip this chunk, like a failed individual delete
+            deleted.extend(_json(response))
         return deleted
+
+    async def delete_all(self, *, max_workers: int = _POOL_SIZE) -> list[str]:
+        """Deletes all active sandboxes.
+
+        Args:
+            max_workers: Maximum number of concurrent delete requests when
+                the server lacks the batch endpoint. Defaults to the
+                connection pool size (32).
+
+        Returns:
+            A list of sandbox IDs that were successfully deleted.
+
+        Raises:
+            Dev2CloudError: If the sandbox list cannot be fetched.
+        """
+        ids = [sb.id for sb in await self.list_sandboxes()]
+        return await self.delete_sandboxes(ids, max_workers=max_workers)
@@ -0,0 +1,86 @@
+import json
+import unittest
+
+from d2c import Dev2CloudError, _JSONArrayParser, _validate_sandboxes
+
+DATA = [
+    {"id": "a,]", "x": "é✓", "n": [1, 2, {"y": "]"}]},
+    {"id": "b"},
+    5,
+    "s",
+    [],
+    {},
+    123,
+    True,
+    None,
+]
+
+
+def parse(raw: bytes, size: int) -> list:
+    parser = _JSONArrayParser()
+    items = []
+    for start in range(0, len(raw), size):
+        items += parser.feed(raw[start : start + size])
+    parser.close()
+    return items
+
+
+class JSONArrayParserTest(unittest.TestCase):
+    def test_chunk_splits(self) -> None:
+        for raw in (
+            json.dumps(DATA, ensure_ascii=False, indent=2).encode(),
+            json.dumps(DATA, separators=(",", ":")).encode(),
+        ):
+            for size in (1, 2, 3, 7, 64, 10000):
+                with self.subTest(raw=raw[:20], size=size):
+                    self.assertEqual(parse(raw, size), DATA)
+
+    def test_numbers_split_across_chunks(self) -> None:
+        for size in (1, 2, 3):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    parse(b"[123, 4567, true, 89]", size), [123, 4567, True, 89]
+                )
+
+    def test_whitespace_and_empty(self) -> None:
+        for raw, expected in ((b" [ ] \n", []), (b"[1]  ", [1]), (b"[[]]", [[]])):
+            for size in (1, 100):
+                with self.subTest(raw=raw, size=size):
+                    self.assertEqual(parse(raw, size), expected)
+
+    def test_malformed(self) -> None:
+        for raw in (
+            b"[,,1 2,,]",
+            b"[1]   trailing garbage",
+            b"[1 2]",
+            b"[1,]",
+            b"[,1]",
+            b"[1,,2]",
+            b"[",
+            b"[1",
+            b'{"a":1}',
+            b"",
+            b"[1]]",
+            b"[\xff]",
+            b'["\xc3',
+        ):
+            for size in (1, 2, 100):
+                with self.subTest(raw=raw, size=size):
+                    with self.assertRaises(Dev2CloudError):
+                        parse(raw, size)
+
+
+class ValidateSandboxesTest(unittest.TestCase):
+    def test_valid(self) -> None:
+        (sandbox,) = _validate_sandboxes(
+            [{"id": "a", "sandbox_type": "redis", "created_at": "2024-01-01T00:00:00Z"}]
+        )
+        self.assertEqual(sandbox.id, "a")
+
+    def test_invalid_element_is_malformed_list(self) -> None:
+        with self.assertRaises(Dev2CloudError):
+            _validate_sandboxes([{"id": "a"}])
+
+
+if __name__ == "__main__":
+    unittest.main()